@@ -1,11 +1,20 @@
 import os
+import re
 import time
+import types
+import signal
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import collections
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import aiohttp
 import requests
+import urllib3
 from prometheus_client import start_http_server, Gauge, Counter
-import schedule
 import json
+import orjson
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # Configure logging
 logging.basicConfig(
@@ -25,10 +34,22 @@ if not REPOSITORIES:
     if owner and repo:
         REPOSITORIES = [{"owner": owner, "repo": repo}]
 
-HEADERS = {
+# Read-only view so the shared sessions can hold the headers by reference
+HEADERS = types.MappingProxyType({
     'Authorization': f'token {GITHUB_TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
-}
+})
+
+# Shared session for the synchronous call sites so they reuse pooled
+# TCP/TLS connections instead of handshaking on every request
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=urllib3.util.Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('https://', _adapter)
 
 # Define Prometheus metrics
 deployment_frequency = Gauge('dora_deployment_frequency', 'Deployments per day', ['repo'])
@@ -36,106 +57,236 @@ lead_time = Gauge('dora_lead_time_seconds', 'Lead time for changes in seconds',
 change_failure_rate = Gauge('dora_change_failure_rate', 'Percentage of deployments that failed', ['repo'])
 mttr = Gauge('dora_mean_time_to_restore_seconds', 'Mean time to restore service in seconds', ['repo'])
 
-deployment_counter = Counter('dora_deployments_total', 'Total number of deployments', ['repo', 'status'])
+# These track totals for the current 30-day window, not monotonic counts,
+# so they are Gauges and can be set directly on every update
+deployment_counter = Gauge('dora_deployments_total', 'Total number of deployments', ['repo', 'status'])
 incident_counter = Counter('dora_incidents_total', 'Total number of incidents', ['repo'])
-recovery_time_sum = Counter('dora_recovery_time_seconds_sum', 'Sum of recovery times in seconds', ['repo'])
-recovery_count = Counter('dora_recovery_count', 'Count of recoveries', ['repo'])
+recovery_time_sum = Gauge('dora_recovery_time_seconds_sum', 'Sum of recovery times in seconds', ['repo'])
+recovery_count = Gauge('dora_recovery_count', 'Count of recoveries', ['repo'])
 
 # Time window for metrics (last 30 days)
 TIME_WINDOW_DAYS = 30
 
-def paginate_github_api(url, params=None):
+# Limit how many repositories are processed concurrently to stay within rate limits
+MAX_CONCURRENT_REPOS = 8
+
+# Limit how many pages of one listing are prefetched concurrently
+MAX_CONCURRENT_PAGES = 8
+
+# Back off proactively once the remaining rate-limit budget drops below this
+RATE_LIMIT_THRESHOLD = 50
+
+# Shared guard so concurrent fetchers back off once instead of dogpiling
+_rate_limit_guard = asyncio.Lock()
+
+async def _respect_rate_limit(headers):
     """
-    Helper function to handle GitHub API pagination and rate limiting
-    Returns all items from all pages
+    Inspect the rate-limit headers GitHub returns on every response and
+    sleep before the budget is exhausted, instead of waiting for 403s
     """
-    if params is None:
-        params = {}
-    
-    all_items = []
-    page = 1
-    per_page = 100
-    
+    remaining = int(headers.get('X-RateLimit-Remaining', 5000))
+    if remaining >= RATE_LIMIT_THRESHOLD:
+        return
+
+    reset_time = int(headers.get('X-RateLimit-Reset', 0))
+    async with _rate_limit_guard:
+        # Recompute inside the guard - whoever slept first already covered the wait
+        wait_time = min(max(0, reset_time - int(time.time())), 60)
+        if wait_time > 0:
+            logger.warning(f"Rate limit nearly exhausted ({remaining} remaining). Backing off {wait_time} seconds.")
+            await asyncio.sleep(wait_time)
+
+# ETags from previous polls, keyed by request URL+params. Sending
+# If-None-Match lets GitHub answer 304 for unchanged pages, which is free
+# on the rate limit and skips the download and JSON parse entirely.
+# Insertion order doubles as recency: hits are moved to the end and the
+# oldest entries are evicted once the cap is reached, so a long-running
+# collector can't grow the cache without bound
+ETAG_CACHE = {}  # cache_key -> (etag, page_items, next_url, last_url)
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+@lru_cache(maxsize=65536)
+def _parse_timestamp(ts):
+    """Parse a GitHub ISO8601 timestamp (cached - far cheaper than strptime)"""
+    return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+
+def _page_url(template_url, page):
+    """Rewrite the page query param of a paginated GitHub URL"""
+    parts = urlsplit(template_url)
+    query = dict(parse_qsl(parts.query))
+    query['page'] = str(page)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def _last_page_number(last_url):
+    """Extract the page number from a Link rel="last" URL"""
+    try:
+        return int(dict(parse_qsl(urlsplit(last_url).query)).get('page', 1))
+    except ValueError:
+        return None
+
+async def _fetch_page(session, url, page_params=None):
+    """
+    Fetch and decode a single page, handling rate limiting and ETag revalidation
+    Returns (page_items, next_url, last_url); page_items is empty on error
+    """
+    cache_key = (url, tuple(sorted(page_params.items())) if page_params else None)
+
     while True:
-        page_params = {**params, 'page': page, 'per_page': per_page}
+        cached = ETAG_CACHE.get(cache_key)
+        if cached:
+            # Refresh recency so eviction drops the stalest keys first
+            ETAG_CACHE[cache_key] = ETAG_CACHE.pop(cache_key)
+        request_headers = {'If-None-Match': cached[0]} if cached else {}
+
         try:
-            response = requests.get(url, headers=HEADERS, params=page_params, timeout=30)
-            
-            # Handle rate limiting
-            if response.status_code == 403 and 'rate limit' in response.text.lower():
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(1, reset_time - int(time.time()) + 5)
-                logger.warning(f"Rate limit hit. Waiting {wait_time} seconds before retrying.")
-                time.sleep(wait_time)
-                continue
-                
-            # Handle other errors
-            if response.status_code != 200:
-                logger.error(f"API request failed: {response.status_code} - {response.text}")
-                return all_items
-                
-            # Process results
-            items = response.json()
-            
-            # Handle different response formats
-            if isinstance(items, dict) and 'items' in items:
-                page_items = items['items']
-                total_count = items.get('total_count', 0)
-            elif isinstance(items, dict) and any(k in items for k in ['workflow_runs', 'commits']):
-                for key in ['workflow_runs', 'commits']:
-                    if key in items:
-                        page_items = items[key]
-                        total_count = items.get('total_count', 0)
-                        break
+            async with session.get(url, params=page_params, headers=request_headers) as response:
+                body = await response.read()
+
+                # Handle rate limiting
+                if response.status == 403 and b'rate limit' in body.lower():
+                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                    wait_time = max(1, reset_time - int(time.time()) + 5)
+                    logger.warning(f"Rate limit hit. Waiting {wait_time} seconds before retrying.")
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                # Page unchanged since the last poll - reuse the cached items
+                if response.status == 304 and cached:
+                    items = None
+                    page_items, next_url, last_url = cached[1], cached[2], cached[3]
+
+                # Handle other errors
+                elif response.status != 200:
+                    logger.error(f"API request failed: {response.status} - {body.decode(errors='replace')}")
+                    return [], None, None
+
+                else:
+                    # The Link header tells us whether more pages exist
+                    next_link = response.links.get('next')
+                    next_url = str(next_link['url']) if next_link else None
+                    last_link = response.links.get('last')
+                    last_url = str(last_link['url']) if last_link else None
+
+                    # Process results (orjson is noticeably faster than the
+                    # stdlib parser on the large workflow-run pages)
+                    items = orjson.loads(body)
+
+            # Sleep proactively if the rate-limit budget is nearly gone
+            await _respect_rate_limit(response.headers)
+
+            if items is not None:
+                # Handle different response formats
+                if isinstance(items, dict) and 'items' in items:
+                    page_items = items['items']
+                elif isinstance(items, dict) and any(k in items for k in ['workflow_runs', 'commits']):
+                    for key in ['workflow_runs', 'commits']:
+                        if key in items:
+                            page_items = items[key]
+                            break
+                    else:
+                        page_items = []
+                elif isinstance(items, list):
+                    page_items = items
                 else:
                     page_items = []
-                    total_count = 0
-            elif isinstance(items, list):
-                page_items = items
-                total_count = len(items)
-            else:
-                page_items = []
-                total_count = 0
-                
-            logger.debug(f"Retrieved {len(page_items)} items from page {page} (total: {total_count})")
-            
+
+                # Remember the page so the next poll can revalidate it for free
+                etag = response.headers.get('ETag')
+                if etag:
+                    ETAG_CACHE[cache_key] = (etag, page_items, next_url, last_url)
+                    while len(ETAG_CACHE) > ETAG_CACHE_MAX_ENTRIES:
+                        ETAG_CACHE.pop(next(iter(ETAG_CACHE)))
+
+            # %-style args defer formatting until DEBUG is actually enabled
+            logger.debug("Retrieved %d items from %s", len(page_items), url)
+
+            return page_items, next_url, last_url
+
+        except Exception as e:
+            logger.error(f"Error during API pagination: {str(e)}")
+            return [], None, None
+
+async def paginate_github_api(session, url, params=None, stop_predicate=None):
+    """
+    Helper function to handle GitHub API pagination and rate limiting
+    Fetches the first page, then uses the Link rel="last" header to prefetch
+    the remaining pages concurrently instead of walking them one at a time
+    Stops early once any item matches stop_predicate, so out-of-window
+    pages are never waited on
+    Returns all items from all pages
+    """
+    if params is None:
+        params = {}
+
+    page_params = {**params, 'per_page': '80'}
+
+    page_items, next_url, last_url = await _fetch_page(session, url, page_params)
+    all_items = list(page_items)
+
+    if not page_items or next_url is None:
+        return all_items
+
+    # Stop early once results fall outside the caller's window
+    if stop_predicate and any(stop_predicate(item) for item in page_items):
+        logger.debug("Stopping pagination early at page 1")
+        return all_items
+
+    last_page = _last_page_number(last_url) if last_url else None
+
+    if last_page and last_page > 1:
+        # Total page count is known up front - fetch pages 2..last concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_page_bounded(page):
+            async with semaphore:
+                return await _fetch_page(session, _page_url(next_url, page))
+
+        pages = await asyncio.gather(*(fetch_page_bounded(p) for p in range(2, last_page + 1)))
+        for page_number, (page_items, _, _) in enumerate(pages, start=2):
+            all_items.extend(page_items)
+            if stop_predicate and any(stop_predicate(item) for item in page_items):
+                logger.debug("Stopping pagination early at page %d", page_number)
+                break
+    else:
+        # No rel="last" hint - follow rel="next" serially
+        page = 2
+        while next_url:
+            page_items, next_url, _ = await _fetch_page(session, next_url)
             if not page_items:
                 break
-                
             all_items.extend(page_items)
-            
-            # Check if we've reached the last page
-            if len(page_items) < per_page:
+            if stop_predicate and any(stop_predicate(item) for item in page_items):
+                logger.debug("Stopping pagination early at page %d", page)
                 break
-                
             page += 1
-            
-        except Exception as e:
-            logger.error(f"Error during API pagination: {str(e)}")
-            break
-            
+
     return all_items
 
-def get_github_workflows(owner, repo):
+async def get_github_workflows(session, owner, repo):
     """Get GitHub workflow runs for a repository within time window"""
     logger.info(f"Fetching workflow runs for {owner}/{repo}")
     
     # Calculate time window
-    now = datetime.now()
+    now = datetime.now(timezone.utc)
     cutoff_date = now - timedelta(days=TIME_WINDOW_DAYS)
     cutoff_date_str = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-    
+
     url = f'https://api.github.com/repos/{owner}/{repo}/actions/runs'
     
     try:
-        # Get all workflow runs
-        all_workflow_runs = paginate_github_api(url)
+        # Get all workflow runs; runs come back newest-first, so stop paginating
+        # as soon as a page contains one older than the cutoff (ISO8601 strings
+        # compare lexicographically)
+        all_workflow_runs = await paginate_github_api(
+            session, url,
+            stop_predicate=lambda run: run.get('created_at', cutoff_date_str) < cutoff_date_str
+        )
         
         # Filter by time window
         recent_workflow_runs = []
         for run in all_workflow_runs:
             try:
-                run_date = datetime.strptime(run['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+                run_date = _parse_timestamp(run['created_at'])
                 if run_date >= cutoff_date:
                     recent_workflow_runs.append(run)
                 elif recent_workflow_runs:  # If we've already added some and now finding older ones, we can stop
@@ -145,14 +296,16 @@ def get_github_workflows(owner, repo):
                 continue
         
         logger.info(f"Retrieved {len(recent_workflow_runs)} workflow runs for {owner}/{repo} within last {TIME_WINDOW_DAYS} days")
+
+        # Classify each run once at ingest so downstream consumers only do a
+        # dict lookup instead of re-running the regex per calculator
+        for run in recent_workflow_runs:
+            run['_deploy'] = is_deployment_workflow(run)
         
         # Log workflow types to help debugging
-        workflow_names = {}
-        for run in recent_workflow_runs:
-            name = run.get('name', 'Unknown')
-            workflow_names[name] = workflow_names.get(name, 0) + 1
-            
-        logger.info(f"Workflow types found: {json.dumps(workflow_names, indent=2)}")
+        workflow_names = collections.Counter(run.get('name', 'Unknown') for run in recent_workflow_runs)
+
+        logger.info(f"Workflow types found: {orjson.dumps(dict(workflow_names), option=orjson.OPT_INDENT_2).decode()}")
         
         return recent_workflow_runs
         
@@ -160,276 +313,259 @@ def get_github_workflows(owner, repo):
         logger.error(f"Failed to fetch workflow runs for {owner}/{repo}: {str(e)}")
         return []
 
-def get_github_commits(owner, repo):
+async def get_github_commits(session, owner, repo):
     """Get GitHub commits for a repository within time window"""
     logger.info(f"Fetching commits for {owner}/{repo}")
     
-    # Calculate time window
-    now = datetime.now()
-    cutoff_date = now - timedelta(days=TIME_WINDOW_DAYS)
+    # Calculate time window; round the cutoff down to a day boundary so the
+    # since param (and the page URLs derived from it) repeats between polls,
+    # letting the ETag cache actually revalidate commit pages
+    now = datetime.now(timezone.utc)
+    cutoff_date = (now - timedelta(days=TIME_WINDOW_DAYS)).replace(hour=0, minute=0, second=0, microsecond=0)
     cutoff_date_str = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-    
+
     url = f'https://api.github.com/repos/{owner}/{repo}/commits'
     params = {'since': cutoff_date_str}
-    
+
     try:
-        commits = paginate_github_api(url, params)
+        commits = await paginate_github_api(session, url, params)
         logger.info(f"Retrieved {len(commits)} commits for {owner}/{repo} since {cutoff_date_str}")
         return commits
     except Exception as e:
         logger.error(f"Failed to fetch commits for {owner}/{repo}: {str(e)}")
         return []
 
+# List of common deployment indicators, compiled into a single pattern so
+# classifying a run is one regex scan instead of ~20 substring scans per field
+DEPLOYMENT_INDICATORS = [
+    'deploy', 'deployment', 'release', 'publish', 'cd',
+    'continuous delivery', 'continuous deployment',
+    'promote', 'provision', 'rollout', 'deploy-to',
+    'deploy_to', 'production', 'staging', 'prod',
+    'push-to', 'push_to', 'delivery', 'build-and-deploy'
+]
+DEPLOYMENT_PATTERN = re.compile('|'.join(map(re.escape, DEPLOYMENT_INDICATORS)), re.IGNORECASE)
+
 def is_deployment_workflow(workflow_run):
     """
     Identify if a workflow run is a deployment workflow
     Using multiple indicators to catch different naming conventions
     """
     # Extract relevant information
-    name = workflow_run.get('name', '').lower()
-    path = workflow_run.get('path', '').lower()
+    name = workflow_run.get('name', '')
+    path = workflow_run.get('path', '')
     workflow_file = workflow_run.get('workflow_file', {})
     if isinstance(workflow_file, dict):
-        file_name = workflow_file.get('name', '').lower()
+        file_name = workflow_file.get('name', '')
     else:
-        file_name = str(workflow_file).lower()
-    
-    # List of common deployment indicators
-    deployment_indicators = [
-        'deploy', 'deployment', 'release', 'publish', 'cd', 
-        'continuous delivery', 'continuous deployment',
-        'promote', 'provision', 'rollout', 'deploy-to', 
-        'deploy_to', 'production', 'staging', 'prod', 
-        'push-to', 'push_to', 'delivery', 'build-and-deploy'
-    ]
-    
-    # Check workflow name
-    for indicator in deployment_indicators:
-        if indicator in name:
-            return True
-            
-    # Check workflow path
-    if path and any(ind in path for ind in deployment_indicators):
-        return True
-        
-    # Check workflow file name
-    if file_name and any(ind in file_name for ind in deployment_indicators):
+        file_name = str(workflow_file)
+
+    # Check workflow name, path and file name against the indicator pattern
+    if DEPLOYMENT_PATTERN.search(name) or DEPLOYMENT_PATTERN.search(path) or DEPLOYMENT_PATTERN.search(file_name):
         return True
-        
+
     # Also check for explicit workflow events that suggest deployment
     if 'event' in workflow_run and workflow_run['event'] in ['deployment', 'release']:
         return True
-        
+
     return False
 
-def calculate_deployment_frequency(workflow_runs, repo_label):
-    """Calculate deployment frequency (deployments per day)"""
-    # Identify deployment workflows
-    deployment_runs = [run for run in workflow_runs if is_deployment_workflow(run)]
-    
-    # Log identified deployment runs
-    logger.info(f"Identified {len(deployment_runs)} deployment workflows out of {len(workflow_runs)} total workflows")
-    
+GRAPHQL_URL = 'https://api.github.com/graphql'
+
+def _fetch_missing_commit_dates(repo_label, shas):
+    """
+    Fetch author dates for many commits in one GraphQL request per 100 SHAs
+    instead of one REST round-trip each
+    Returns a dict of sha -> ISO8601 author date
+    """
+    owner, repo = repo_label.split('/')
+    commit_dates = {}
+
+    for start in range(0, len(shas), 100):
+        batch = shas[start:start + 100]
+        selections = ' '.join(
+            f'c{i}: object(oid: "{sha}") {{ ... on Commit {{ oid authoredDate }} }}'
+            for i, sha in enumerate(batch)
+        )
+        query = f'query {{ repository(owner: "{owner}", name: "{repo}") {{ {selections} }} }}'
+
+        try:
+            response = SESSION.post(GRAPHQL_URL, json={'query': query}, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"GraphQL commit lookup failed: {response.status_code} - {response.text}")
+                continue
+
+            repository = (response.json().get('data') or {}).get('repository') or {}
+            for node in repository.values():
+                if node and node.get('authoredDate'):
+                    commit_dates[node['oid']] = node['authoredDate']
+        except Exception as e:
+            logger.warning(f"Error batch fetching commits: {str(e)}")
+
+    return commit_dates
+
+async def _fuse_metrics(deployment_runs, commits, repo_label):
+    """
+    Compute all four DORA metrics in a single pass over the deployment runs
+    Each run's created_at is parsed exactly once, then the parsed tuples are
+    shared between the frequency, lead time, failure rate and MTTR calculations
+    Returns (deployments_per_day, avg_lead_time, failure_rate, avg_restore_time)
+    """
     if deployment_runs:
         sample_size = min(3, len(deployment_runs))
         logger.info(f"Sample deployment workflows:")
         for i in range(sample_size):
             run = deployment_runs[i]
             logger.info(f"  - {run.get('name')} ({run.get('created_at')}, status: {run.get('conclusion')})")
-    
-    # Count successful and failed deployments
-    successful_deployments = [run for run in deployment_runs if run.get('conclusion') == 'success']
-    failed_deployments = [run for run in deployment_runs if run.get('conclusion') == 'failure']
-    
-    # Set counter values (not incrementing to avoid duplication)
-    try:
-        deployment_counter.labels(repo=repo_label, status="success")._value.set(len(successful_deployments))
-        deployment_counter.labels(repo=repo_label, status="failure")._value.set(len(failed_deployments))
-    except AttributeError:
-        # Fallback method if the above doesn't work
-        logger.warning("Using alternative method to set counter values")
-        # Clear previous values
-        deployment_counter.labels(repo=repo_label, status="success")._value.inc(-deployment_counter.labels(repo=repo_label, status="success")._value.get())
-        deployment_counter.labels(repo=repo_label, status="failure")._value.inc(-deployment_counter.labels(repo=repo_label, status="failure")._value.get())
-        # Set new values
-        deployment_counter.labels(repo=repo_label, status="success")._value.inc(len(successful_deployments))
-        deployment_counter.labels(repo=repo_label, status="failure")._value.inc(len(failed_deployments))
-    
-    # Calculate deployments per day
+
+    # Single pass: parse each timestamp once and partition by conclusion
+    parsed_runs = []  # (run_time, conclusion, head_sha)
+    successful_deployments = 0
+    failed_deployments = 0
+
+    for run in deployment_runs:
+        try:
+            run_time = _parse_timestamp(run['created_at'])
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Error parsing deployment run date: {str(e)}")
+            continue
+
+        conclusion = run.get('conclusion')
+        if conclusion == 'success':
+            successful_deployments += 1
+        elif conclusion == 'failure':
+            failed_deployments += 1
+
+        parsed_runs.append((run_time, conclusion, run.get('head_sha')))
+
+    # --- Deployment frequency ---
+    deployment_counter.labels(repo=repo_label, status="success").set(successful_deployments)
+    deployment_counter.labels(repo=repo_label, status="failure").set(failed_deployments)
+
     total_deployments = len(deployment_runs)
     deployments_per_day = total_deployments / TIME_WINDOW_DAYS if TIME_WINDOW_DAYS > 0 else 0
-    
+
     logger.info(f"Deployment frequency: {deployments_per_day:.4f} deployments/day ({total_deployments} deployments in {TIME_WINDOW_DAYS} days)")
-    
-    return deployments_per_day
-
-def calculate_lead_time(workflow_runs, commits, repo_label):
-    """Calculate lead time for changes (time from commit to deployment)"""
-    # Find successful deployment runs
-    deployment_runs = [
-        run for run in workflow_runs 
-        if is_deployment_workflow(run) and run.get('conclusion') == 'success'
+
+    # --- Change failure rate ---
+    concluded_deployments = successful_deployments + failed_deployments
+    if concluded_deployments > 0:
+        failure_rate = (failed_deployments / concluded_deployments) * 100
+    else:
+        failure_rate = 0
+
+    logger.info(f"Change failure rate: {failure_rate:.2f}% ({failed_deployments} failures out of {concluded_deployments} deployments)")
+
+    # --- Lead time for changes (commit to deployment) ---
+    logger.info(f"Calculating lead time using {successful_deployments} successful deployments")
+
+    # Index commits by SHA once so each deployment lookup is O(1)
+    commits_by_sha = {c['sha']: c for c in commits}
+
+    # Batch-fetch any commits missing from the time window in a single
+    # GraphQL request instead of one REST round-trip per miss
+    missing_shas = [
+        head_sha for _, conclusion, head_sha in parsed_runs
+        if conclusion == 'success' and head_sha and head_sha not in commits_by_sha
     ]
-    
-    logger.info(f"Calculating lead time using {len(deployment_runs)} successful deployments")
-    
+    if missing_shas:
+        logger.info(f"Batch fetching {len(missing_shas)} commits not found in the prefetched list")
+        # The GraphQL POST goes through the blocking session, so run it on a
+        # worker thread to keep the other repos' coroutines moving
+        missing_dates = await asyncio.to_thread(_fetch_missing_commit_dates, repo_label, missing_shas)
+        for sha, date in missing_dates.items():
+            # Mirror the REST commit shape so the loop below stays uniform
+            commits_by_sha[sha] = {'sha': sha, 'commit': {'author': {'date': date}}}
+
     lead_times = []
     processed_commits = 0
-    
-    for run in deployment_runs:
+
+    for run_time, conclusion, head_sha in parsed_runs:
+        if conclusion != 'success' or not head_sha:
+            continue
+
         try:
-            deployment_time = datetime.strptime(run['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            
-            # Get the associated commit
-            head_sha = run.get('head_sha')
-            if not head_sha:
-                continue
-                
-            # Try to find the commit in our list
-            commit_info = None
-            for commit in commits:
-                if commit['sha'] == head_sha:
-                    commit_info = commit
-                    break
-            
-            if not commit_info:
-                # If not found in our list, fetch it directly
-                try:
-                    owner, repo = repo_label.split('/')
-                    url = f'https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}'
-                    response = requests.get(url, headers=HEADERS, timeout=30)
-                    if response.status_code == 200:
-                        commit_info = response.json()
-                except Exception as e:
-                    logger.warning(f"Error fetching commit {head_sha}: {str(e)}")
-            
+            commit_info = commits_by_sha.get(head_sha)
+
             if commit_info:
                 processed_commits += 1
-                commit_time = datetime.strptime(
-                    commit_info['commit']['author']['date'], 
-                    '%Y-%m-%dT%H:%M:%SZ'
-                )
-                lead_time_seconds = (deployment_time - commit_time).total_seconds()
+                commit_time = _parse_timestamp(commit_info['commit']['author']['date'])
+                lead_time_seconds = (run_time - commit_time).total_seconds()
                 if lead_time_seconds > 0:  # Only consider positive lead times
                     lead_times.append(lead_time_seconds)
-                    logger.debug(f"Lead time for commit {head_sha}: {lead_time_seconds/3600:.2f} hours")
-        
+                    logger.debug("Lead time for commit %s: %.2f hours", head_sha, lead_time_seconds / 3600)
+
         except Exception as e:
-            logger.warning(f"Error processing lead time for run {run.get('id')}: {str(e)}")
-    
+            logger.warning(f"Error processing lead time for commit {head_sha}: {str(e)}")
+
     logger.info(f"Processed {processed_commits} commits for lead time calculation")
-    
+
     avg_lead_time = sum(lead_times) / len(lead_times) if lead_times else 0
     logger.info(f"Average lead time: {avg_lead_time/3600:.2f} hours (based on {len(lead_times)} data points)")
-    
-    return avg_lead_time
-
-def calculate_change_failure_rate(workflow_runs):
-    """Calculate change failure rate (percentage of deployments that failed)"""
-    # Get all deployment runs with success or failure conclusion
-    deployment_runs = [
-        run for run in workflow_runs 
-        if is_deployment_workflow(run) and run.get('conclusion') in ['success', 'failure']
-    ]
-    
-    total_deployments = len(deployment_runs)
-    failed_deployments = len([run for run in deployment_runs if run.get('conclusion') == 'failure'])
-    
-    if total_deployments > 0:
-        failure_rate = (failed_deployments / total_deployments) * 100
-    else:
-        failure_rate = 0
-        
-    logger.info(f"Change failure rate: {failure_rate:.2f}% ({failed_deployments} failures out of {total_deployments} deployments)")
-    
-    return failure_rate
 
-def calculate_mttr(workflow_runs, repo_label):
-    """
-    Calculate mean time to restore service 
-    (time between a failed deployment and the next successful one)
-    """
-    # Sort deployment runs by time
-    deployment_runs = sorted(
-        [run for run in workflow_runs if is_deployment_workflow(run) and run.get('conclusion') in ['success', 'failure']],
-        key=lambda x: datetime.strptime(x['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-    )
-    
-    logger.info(f"Calculating MTTR using {len(deployment_runs)} deployment runs")
-    
+    # --- Mean time to restore (failed deployment to next successful one) ---
+    # GitHub returns runs newest-first, so reversing the already-parsed tuples
+    # gives chronological order without an O(N log N) sort
+    concluded_runs = [p for p in reversed(parsed_runs) if p[1] in ('success', 'failure')]
+
+    logger.info(f"Calculating MTTR using {len(concluded_runs)} deployment runs")
+
     restore_times = []
     failure_time = None
     total_restore_time = 0
-    
-    for run in deployment_runs:
-        try:
-            current_time = datetime.strptime(run['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            
-            if run.get('conclusion') == 'failure' and failure_time is None:
-                failure_time = current_time
-                logger.debug(f"Failure detected at {failure_time.isoformat()}")
-                
-            elif run.get('conclusion') == 'success' and failure_time is not None:
-                restore_time = (current_time - failure_time).total_seconds()
-                restore_times.append(restore_time)
-                total_restore_time += restore_time
-                logger.debug(f"Restore detected after {restore_time/3600:.2f} hours")
-                failure_time = None
-                
-        except Exception as e:
-            logger.warning(f"Error processing MTTR data point: {str(e)}")
-    
+
+    for current_time, conclusion, _ in concluded_runs:
+        if conclusion == 'failure' and failure_time is None:
+            failure_time = current_time
+            logger.debug("Failure detected at %s", failure_time)
+
+        elif conclusion == 'success' and failure_time is not None:
+            restore_time = (current_time - failure_time).total_seconds()
+            restore_times.append(restore_time)
+            total_restore_time += restore_time
+            logger.debug("Restore detected after %.2f hours", restore_time / 3600)
+            failure_time = None
+
     # Update the MTTR metrics
     recovery_count_value = len(restore_times)
-    
-    try:
-        if recovery_count_value > 0:
-            recovery_time_sum.labels(repo=repo_label)._value.set(total_restore_time)
-            recovery_count.labels(repo=repo_label)._value.set(recovery_count_value)
-    except AttributeError:
-        # Fallback method
-        if recovery_count_value > 0:
-            # Clear previous values
-            recovery_time_sum.labels(repo=repo_label)._value.inc(-recovery_time_sum.labels(repo=repo_label)._value.get())
-            recovery_count.labels(repo=repo_label)._value.inc(-recovery_count.labels(repo=repo_label)._value.get())
-            # Set new values
-            recovery_time_sum.labels(repo=repo_label)._value.inc(total_restore_time)
-            recovery_count.labels(repo=repo_label)._value.inc(recovery_count_value)
-    
+
+    if recovery_count_value > 0:
+        recovery_time_sum.labels(repo=repo_label).set(total_restore_time)
+        recovery_count.labels(repo=repo_label).set(recovery_count_value)
+
     avg_restore_time = total_restore_time / recovery_count_value if recovery_count_value > 0 else 0
-    
+
     logger.info(f"MTTR: {avg_restore_time/3600:.2f} hours (based on {recovery_count_value} recoveries)")
-    
-    return avg_restore_time
 
-def update_metrics_for_repo(owner, repo):
+    return deployments_per_day, avg_lead_time, failure_rate, avg_restore_time
+
+async def update_metrics_for_repo(session, owner, repo):
     """Update DORA metrics for a specific repository"""
     repo_label = f"{owner}/{repo}"
     logger.info(f"========== Updating DORA metrics for {repo_label} ==========")
-    
+
     try:
-        # Get workflow runs within time window
-        workflow_runs = get_github_workflows(owner, repo)
+        # Fetch workflow runs and commits for the time window concurrently
+        workflow_runs, commits = await asyncio.gather(
+            get_github_workflows(session, owner, repo),
+            get_github_commits(session, owner, repo)
+        )
         if not workflow_runs:
             logger.warning(f"No workflow runs found for {repo_label}. Skipping this repository.")
             return
-        
-        # Get commits within time window
-        commits = get_github_commits(owner, repo)
+
         if not commits:
             logger.warning(f"No commits found for {repo_label}. Some metrics may be incomplete.")
-        
-        # Calculate and update metrics
-        df = calculate_deployment_frequency(workflow_runs, repo_label)
+
+        # Identify deployment workflows once and share the filtered list
+        deployment_runs = [run for run in workflow_runs if run.get('_deploy')]
+        logger.info(f"Identified {len(deployment_runs)} deployment workflows out of {len(workflow_runs)} total workflows")
+
+        # Calculate and update metrics in one pass over the deployment runs
+        df, lt, cfr, mttr_value = await _fuse_metrics(deployment_runs, commits, repo_label)
         deployment_frequency.labels(repo=repo_label).set(df)
-        
-        lt = calculate_lead_time(workflow_runs, commits, repo_label)
         lead_time.labels(repo=repo_label).set(lt)
-        
-        cfr = calculate_change_failure_rate(workflow_runs)
         change_failure_rate.labels(repo=repo_label).set(cfr)
-        
-        mttr_value = calculate_mttr(workflow_runs, repo_label)
         mttr.labels(repo=repo_label).set(mttr_value)
         
         logger.info(f"=== Summary for {repo_label} ===")
@@ -442,46 +578,68 @@ def update_metrics_for_repo(owner, repo):
     except Exception as e:
         logger.error(f"Error updating metrics for {repo_label}: {str(e)}", exc_info=True)
 
-def update_metrics():
+async def update_metrics(session):
     """Update all DORA metrics for all repositories"""
     logger.info(f"====================================================")
     logger.info(f"Starting metrics update for {len(REPOSITORIES)} repositories...")
     logger.info(f"====================================================")
-    
+
     start_time = time.time()
-    
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPOS)
+
+    async def update_with_limit(owner, repo):
+        async with semaphore:
+            await update_metrics_for_repo(session, owner, repo)
+
+    tasks = []
     for repo_config in REPOSITORIES:
         owner = repo_config.get('owner')
         repo = repo_config.get('repo')
-        
+
         if owner and repo:
-            update_metrics_for_repo(owner, repo)
+            tasks.append(update_with_limit(owner, repo))
         else:
             logger.warning(f"Skipping invalid repository config: {repo_config}")
-    
+
+    await asyncio.gather(*tasks)
+
     elapsed_time = time.time() - start_time
     logger.info(f"Metrics update completed in {elapsed_time:.2f} seconds")
 
+# Re-verify the token at most this often, so hot-reloads with the same
+# config don't spam the /user endpoint
+ACCESS_CHECK_TTL_SECONDS = 600
+_access_check_cache = None  # (timestamp, ok)
+
 def check_github_access():
     """Check if GitHub token is valid and has required permissions"""
+    global _access_check_cache
+
+    if _access_check_cache and time.time() - _access_check_cache[0] < ACCESS_CHECK_TTL_SECONDS:
+        return _access_check_cache[1]
+
     logger.info("Checking GitHub API access...")
-    
+
     try:
-        response = requests.get('https://api.github.com/user', headers=HEADERS, timeout=10)
-        
+        response = SESSION.get('https://api.github.com/user', timeout=10)
+
         if response.status_code == 200:
             user_data = response.json()
             logger.info(f"GitHub access confirmed for user: {user_data.get('login')}")
-            return True
+            ok = True
         else:
             logger.error(f"GitHub API access check failed: {response.status_code} - {response.text}")
-            return False
-            
+            ok = False
+
     except Exception as e:
         logger.error(f"Error checking GitHub access: {str(e)}")
-        return False
+        ok = False
 
-def main():
+    _access_check_cache = (time.time(), ok)
+    return ok
+
+async def main():
     """Main function"""
     logger.info("Starting DORA metrics collector")
     
@@ -510,25 +668,34 @@ def main():
     logger.info(f'Tracking {len(REPOSITORIES)} repositories:')
     for repo in REPOSITORIES:
         logger.info(f"  - {repo.get('owner', 'N/A')}/{repo.get('repo', 'N/A')}")
-    
-    # Initial update
-    update_metrics()
-    
-    # Schedule regular updates
+
     update_interval = int(os.environ.get('UPDATE_INTERVAL_HOURS', 1))
     logger.info(f"Scheduling updates every {update_interval} hours")
-    schedule.every(update_interval).hours.do(update_metrics)
-    
+
+    # Shut down cleanly on SIGINT/SIGTERM instead of relying on KeyboardInterrupt
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
     # Main loop
     logger.info("Entering main loop - press Ctrl+C to exit")
-    try:
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Application stopped by user")
-    except Exception as e:
-        logger.error(f"Unexpected error in main loop: {str(e)}", exc_info=True)
+    connector = aiohttp.TCPConnector(limit=20)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+        while not stop_event.is_set():
+            try:
+                await update_metrics(session)
+            except Exception as e:
+                logger.error(f"Unexpected error in main loop: {str(e)}", exc_info=True)
+
+            # Sleep until the next update, waking immediately on shutdown
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=update_interval * 3600)
+            except asyncio.TimeoutError:
+                pass
+
+    logger.info("Application stopped by user")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())